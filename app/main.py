@@ -3,6 +3,11 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
+import hashlib
+import json
+import logging
+import re
 import sys
 from pathlib import Path
 
@@ -12,28 +17,62 @@ if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
 from utils.agents import (
+    CHUNK_TARGET_CHARS,
     DialogueAgent,
     TranscriptCorrectionAgent,
     TranslationAgent,
     VideoTranscriptAgent,
 )
+from utils.batch_client import (
+    build_batch_request,
+    download_batch_results,
+    submit_batch,
+    wait_for_batch,
+)
+from utils.chunking import split_on_sentences, stitch_chunks
+from utils.llm_client import build_responses_body
+from utils.prompt_loader import load_prompt
+
+logger = logging.getLogger(__name__)
+
+VIDEO_DIR = REPO_ROOT / "data" / "video"
+TRANSCRIPT_DIR = REPO_ROOT / "data" / "transcript"
+OUTPUT_DIR = REPO_ROOT / "data" / "output"
+
+_WS_RE = re.compile(r"\s+")
+_prepared_dirs: set[Path] = set()
 
 
 def extract_transcript_passage(full_text: str, max_chars: int = 6000) -> str:
     """Extract a manageable transcript passage for downstream LLM processing."""
-    compact = " ".join(full_text.split())
+    # Bound the input before normalizing; the slack absorbs collapsed whitespace.
+    if len(full_text) > max_chars * 2:
+        full_text = full_text[: max_chars * 2]
+    compact = _WS_RE.sub(" ", full_text).strip()
     if len(compact) <= max_chars:
         return compact
     trimmed = compact[:max_chars].rsplit(" ", 1)[0]
     return trimmed + "..."
 
 
+def prepare_dir(path: Path) -> None:
+    """Create a directory once per process; later calls are a set lookup."""
+    if path not in _prepared_dirs:
+        path.mkdir(parents=True, exist_ok=True)
+        _prepared_dirs.add(path)
+
+
 def save_text(path: Path, text: str) -> None:
     """Write text content to disk, ensuring the parent directory exists."""
-    path.parent.mkdir(parents=True, exist_ok=True)
+    prepare_dir(path.parent)
     path.write_text(text, encoding="utf-8")
 
 
+async def asave_text(path: Path, text: str) -> None:
+    """Write text content from a worker thread so the event loop keeps running."""
+    await asyncio.to_thread(save_text, path, text)
+
+
 def load_text(path: Path) -> str:
     """Read text content from disk."""
     return path.read_text(encoding="utf-8")
@@ -46,16 +85,229 @@ def build_output_paths(stem: str, output_dir: Path) -> dict[str, Path]:
         "corrected": output_dir / f"{stem}_corrected.txt",
         "translated": output_dir / f"{stem}_tr_istanbul.txt",
         "dialogue": output_dir / f"{stem}_dialogue.txt",
+        "manifest": output_dir / f"{stem}.manifest.json",
     }
 
 
+def load_manifest(path: Path) -> dict[str, str]:
+    """Load the stage manifest (stage name -> sha256 of its output), or {} if absent."""
+    try:
+        state = json.loads(load_text(path))
+    except FileNotFoundError:
+        return {}
+    except ValueError:
+        # Corrupt or partially written manifest; redo the stages (LLM calls hit the disk cache).
+        logger.warning(f"Ignoring unreadable manifest: {path}")
+        return {}
+    return state if isinstance(state, dict) else {}
+
+
+def save_manifest(path: Path, state: dict[str, str]) -> None:
+    """Persist the stage manifest."""
+    save_text(path, json.dumps(state, indent=2, sort_keys=True))
+
+
+def load_stage(state: dict[str, str], stage: str, path: Path) -> str | None:
+    """Return a stage's saved output if the manifest records it, else None."""
+    if stage not in state:
+        return None
+    try:
+        return load_text(path)
+    except FileNotFoundError:
+        return None
+
+
+def _sha256(text: str) -> str:
+    """Hash stage output for the manifest."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def ingest_url(
+    url: str, args: argparse.Namespace
+) -> tuple[Path, Path, dict[str, Path], str, dict[str, str]]:
+    """Download the video + transcript and return paths, passage, and the stage manifest."""
+    video_agent = VideoTranscriptAgent(video_dir=VIDEO_DIR, transcript_dir=TRANSCRIPT_DIR)
+    video_path, transcript_path, transcript_text = video_agent.run(url, max_chars=args.passage_chars)
+    passage = extract_transcript_passage(transcript_text, max_chars=args.passage_chars)
+
+    output_paths = build_output_paths(Path(transcript_path).stem, OUTPUT_DIR)
+    state = load_manifest(output_paths["manifest"])
+    saved_passage = load_stage(state, "passage", output_paths["passage"])
+    if saved_passage is not None:
+        passage = saved_passage
+    else:
+        save_text(output_paths["passage"], passage)
+        state["passage"] = _sha256(passage)
+    return video_path, transcript_path, output_paths, passage, state
+
+
+def print_outputs(url: str, video_path: Path, transcript_path: Path, output_paths: dict[str, Path]) -> None:
+    """Print where each artifact for a URL was written."""
+    print("URL:", url)
+    print("Video saved to:", video_path)
+    print("Transcript saved to:", transcript_path)
+    print("Passage saved to:", output_paths["passage"])
+    print("Corrected transcript saved to:", output_paths["corrected"])
+    print("Translated transcript saved to:", output_paths["translated"])
+    print("Dialogue transcript saved to:", output_paths["dialogue"])
+
+
+async def process_url(url: str, args: argparse.Namespace, semaphore: asyncio.Semaphore) -> None:
+    """Run the full download/correct/translate/dialogue pipeline for one URL."""
+    async with semaphore:
+        video_path, transcript_path, output_paths, passage, state = await asyncio.to_thread(
+            ingest_url, url, args
+        )
+
+        # Stages stay serial per URL (each feeds the next); disk writes run in a
+        # worker thread so they overlap with the next LLM call. A stage enters
+        # the manifest only once its write has succeeded and its output is non-empty.
+        pending_writes: dict[str, tuple[asyncio.Task[None], str | None]] = {}
+
+        def write_later(stage: str, text: str) -> None:
+            task = asyncio.create_task(asave_text(output_paths[stage], text))
+            pending_writes[stage] = (task, _sha256(text) if text.strip() else None)
+
+        write_errors: list[BaseException] = []
+        try:
+            corrected = load_stage(state, "corrected", output_paths["corrected"])
+            if corrected is None:
+                correction_agent = TranscriptCorrectionAgent(use_cache=not args.no_cache)
+                corrected = await correction_agent.run(passage, model_name=args.model)
+                write_later("corrected", corrected)
+
+            translated = load_stage(state, "translated", output_paths["translated"])
+            if translated is None:
+                translation_agent = TranslationAgent(use_cache=not args.no_cache)
+                translated = await translation_agent.run(corrected, model_name=args.model)
+                write_later("translated", translated)
+
+            dialogue = load_stage(state, "dialogue", output_paths["dialogue"])
+            if dialogue is None:
+                dialogue_agent = DialogueAgent(use_cache=not args.no_cache)
+                dialogue = await dialogue_agent.run(translated, model_name=args.model)
+                write_later("dialogue", dialogue)
+        finally:
+            # Persist whatever finished, even if a later stage raised.
+            results = await asyncio.gather(
+                *(task for task, _ in pending_writes.values()), return_exceptions=True
+            )
+            for (stage, (_, digest)), result in zip(pending_writes.items(), results):
+                if isinstance(result, BaseException):
+                    write_errors.append(result)
+                elif digest is not None:
+                    state[stage] = digest
+            await asyncio.to_thread(save_manifest, output_paths["manifest"], state)
+
+        if write_errors:
+            raise write_errors[0]
+
+    print_outputs(url, video_path, transcript_path, output_paths)
+
+
+async def run_pipelines(urls: list[str], args: argparse.Namespace) -> list[str]:
+    """Process several URLs concurrently, bounded by `--max-concurrency`.
+
+    A failing URL is logged and does not cancel the others; the failed URLs
+    are returned.
+    """
+    semaphore = asyncio.Semaphore(max(1, args.max_concurrency))
+    results = await asyncio.gather(
+        *(process_url(url, args, semaphore) for url in urls),
+        return_exceptions=True,
+    )
+    failed: list[str] = []
+    for url, result in zip(urls, results):
+        if isinstance(result, BaseException):
+            logger.error(f"Pipeline failed for {url}", exc_info=result)
+            failed.append(url)
+    return failed
+
+
+BATCH_STAGES = (
+    ("corrected", "passage", TranscriptCorrectionAgent),
+    ("translated", "corrected", TranslationAgent),
+    ("dialogue", "translated", DialogueAgent),
+)
+
+
+def run_batch(urls: list[str], args: argparse.Namespace) -> list[str]:
+    """Process URLs through the OpenAI Batch API, submitting one batch per stage.
+
+    Stages depend on each other's output, so each stage is submitted for all
+    URLs at once and the next stage starts once the batch completes. A URL
+    whose requests fail is logged and dropped from later stages; the failed
+    URLs are returned.
+    """
+    runs = [(url, *ingest_url(url, args)) for url in urls]
+    texts = [{"passage": passage} for *_, passage, _ in runs]
+    failed: set[int] = set()
+
+    try:
+        for stage, source, agent_cls in BATCH_STAGES:
+            agent = agent_cls()
+            system_prompt = load_prompt(agent.prompt_name)
+            requests: list[dict] = []
+            chunk_counts: dict[int, int] = {}
+            for index, (_, _, _, output_paths, _, state) in enumerate(runs):
+                if index in failed:
+                    continue
+                saved = load_stage(state, stage, output_paths[stage])
+                if saved is not None:
+                    texts[index][stage] = saved
+                    continue
+                source_text = texts[index][source]
+                if agent.chunked:
+                    chunks = split_on_sentences(source_text, target_chars=CHUNK_TARGET_CHARS)
+                else:
+                    chunks = [source_text]
+                chunk_counts[index] = len(chunks)
+                for part, chunk in enumerate(chunks):
+                    body = build_responses_body(
+                        system_prompt=system_prompt,
+                        user_payload=agent.build_payload(chunk),
+                        model_name=args.model,
+                    )
+                    requests.append(build_batch_request(f"{index}:{stage}:{part}", body))
+
+            if not requests:
+                continue
+            batch = wait_for_batch(submit_batch(requests), poll_seconds=args.batch_poll_seconds)
+            results, errors = download_batch_results(batch)
+            for index, count in chunk_counts.items():
+                custom_ids = [f"{index}:{stage}:{part}" for part in range(count)]
+                missing = [custom_id for custom_id in custom_ids if custom_id not in results]
+                if missing:
+                    details = "; ".join(f"{cid}: {errors.get(cid, 'no result returned')}" for cid in missing)
+                    logger.error(f"Batch stage '{stage}' failed for {runs[index][0]}: {details}")
+                    failed.add(index)
+                    continue
+                text = stitch_chunks([results[custom_id] for custom_id in custom_ids])
+                _, _, _, output_paths, _, state = runs[index]
+                save_text(output_paths[stage], text)
+                if text.strip():
+                    state[stage] = _sha256(text)
+                texts[index][stage] = text
+    finally:
+        # Record completed stages even if a later batch fails.
+        for _, _, _, output_paths, _, state in runs:
+            save_manifest(output_paths["manifest"], state)
+
+    for index, (url, video_path, transcript_path, output_paths, _, _) in enumerate(runs):
+        if index not in failed:
+            print_outputs(url, video_path, transcript_path, output_paths)
+    return [runs[index][0] for index in sorted(failed)]
+
+
 def main() -> None:
-    """Run the multi-agent pipeline on a YouTube URL."""
+    """Run the multi-agent pipeline on one or more YouTube URLs."""
     parser = argparse.ArgumentParser(description="YouTube video and transcript processor.")
     parser.add_argument(
+        "--urls",
         "--url",
-        default="https://www.youtube.com/watch?v=TVUibwoVXZc",
-        help="YouTube video URL to process.",
+        nargs="+",
+        default=["https://www.youtube.com/watch?v=TVUibwoVXZc"],
+        help="One or more YouTube video URLs to process.",
     )
     parser.add_argument(
         "--model",
@@ -68,62 +320,45 @@ def main() -> None:
         default=600000,
         help="Maximum number of characters to keep from the transcript passage.",
     )
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=4,
+        help="Maximum number of URL pipelines to run at the same time.",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the on-disk LLM response cache in data/.llm_cache.",
+    )
+    parser.add_argument(
+        "--mode",
+        choices=["online", "batch"],
+        default="online",
+        help="'online' calls the model directly; 'batch' uses the OpenAI Batch API (cheaper, slower).",
+    )
+    parser.add_argument(
+        "--batch-poll-seconds",
+        type=float,
+        default=30,
+        help="Seconds between Batch API status checks in batch mode.",
+    )
     args = parser.parse_args()
 
-    video_dir = REPO_ROOT / "data" / "video"
-    transcript_dir = REPO_ROOT / "data" / "transcript"
-    output_dir = REPO_ROOT / "data" / "output"
-
-    video_agent = VideoTranscriptAgent(video_dir=video_dir, transcript_dir=transcript_dir)
-    video_path, transcript_path, transcript_text = video_agent.run(args.url)
-    passage = extract_transcript_passage(transcript_text, max_chars=args.passage_chars)
-
-    output_paths = build_output_paths(Path(transcript_path).stem, output_dir)
-    if output_paths["passage"].exists():
-        passage = load_text(output_paths["passage"])
-    else:
-        save_text(output_paths["passage"], passage)
+    # Surface this project's INFO progress (e.g. batch polling) without
+    # turning on INFO logs from third-party libraries.
+    logging.basicConfig(format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    logging.getLogger("utils").setLevel(logging.INFO)
+    logger.setLevel(logging.INFO)
 
-    if output_paths["corrected"].exists():
-        corrected = load_text(output_paths["corrected"])
+    prepare_dir(OUTPUT_DIR)
+    if args.mode == "batch":
+        failed = run_batch(args.urls, args)
     else:
-        correction_agent = TranscriptCorrectionAgent()
-        corrected = correction_agent.run(passage, model_name=args.model)
-        if type(corrected) == list:
-            save_text(output_paths["corrected"], corrected[0]["text"])
-            corrected = corrected[0]["text"]
-        else:
-            save_text(output_paths["corrected"], corrected)
-
-    if output_paths["translated"].exists():
-        translated = load_text(output_paths["translated"])
-    else:
-        translation_agent = TranslationAgent()
-        translated = translation_agent.run(corrected, model_name=args.model)
-        if type(translated) == list:
-            save_text(output_paths["translated"], translated[0]["text"])
-            translated = translated[0]["text"]
-        else:
-            save_text(output_paths["translated"], translated)
-
-    if output_paths["dialogue"].exists():
-        dialogue = load_text(output_paths["dialogue"])
-    else:
-        dialogue_agent = DialogueAgent()
-        dialogue = dialogue_agent.run(translated, model_name=args.model)
-        if type(dialogue) == list:
-            save_text(output_paths["dialogue"], dialogue[0]["text"])
-            dialogue = dialogue[0]["text"]
-        else:
-            save_text(output_paths["dialogue"], dialogue)
-    
-
-    print("Video saved to:", video_path)
-    print("Transcript saved to:", transcript_path)
-    print("Passage saved to:", output_paths["passage"])
-    print("Corrected transcript saved to:", output_paths["corrected"])
-    print("Translated transcript saved to:", output_paths["translated"])
-    print("Dialogue transcript saved to:", output_paths["dialogue"])
+        failed = asyncio.run(run_pipelines(args.urls, args))
+    if failed:
+        print(f"{len(failed)} of {len(args.urls)} URL(s) failed:", ", ".join(failed), file=sys.stderr)
+        sys.exit(1)
 
 
 if __name__ == "__main__":
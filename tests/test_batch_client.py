@@ -0,0 +1,56 @@
+"""Tests for utils.batch_client result parsing."""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("openai")
+
+from utils import batch_client  # noqa: E402
+
+
+def _ok(custom_id, text):
+    body = {"output": [{"type": "message", "content": [{"type": "output_text", "text": text}]}]}
+    return {"custom_id": custom_id, "response": {"status_code": 200, "body": body}, "error": None}
+
+
+class _Files:
+    def __init__(self, contents):
+        self._contents = contents
+
+    def content(self, file_id):
+        lines = "\n".join(json.dumps(record) for record in self._contents[file_id])
+        return SimpleNamespace(text=lines)
+
+
+def _client(contents):
+    return SimpleNamespace(files=_Files(contents))
+
+
+def test_results_and_error_file_are_both_read(monkeypatch):
+    failed = {
+        "custom_id": "0:corrected:1",
+        "response": {"status_code": 400, "body": {"error": {"message": "context too long"}}},
+        "error": None,
+    }
+    contents = {"out": [_ok("0:corrected:0", "fixed")], "err": [failed]}
+    monkeypatch.setattr(batch_client, "_get_client", lambda: _client(contents))
+    batch = SimpleNamespace(id="b", output_file_id="out", error_file_id="err")
+
+    results, errors = batch_client.download_batch_results(batch)
+
+    assert results == {"0:corrected:0": "fixed"}
+    assert set(errors) == {"0:corrected:1"}
+    assert "context too long" in errors["0:corrected:1"]
+
+
+def test_batch_with_only_an_error_file(monkeypatch):
+    failed = {"custom_id": "0:dialogue:0", "response": None, "error": {"message": "bad body"}}
+    monkeypatch.setattr(batch_client, "_get_client", lambda: _client({"err": [failed]}))
+    batch = SimpleNamespace(id="b", output_file_id=None, error_file_id="err")
+
+    results, errors = batch_client.download_batch_results(batch)
+
+    assert results == {}
+    assert "bad body" in errors["0:dialogue:0"]
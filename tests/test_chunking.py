@@ -0,0 +1,53 @@
+"""Tests for utils.chunking."""
+
+from utils.chunking import split_on_sentences, stitch_chunks
+
+
+def _sentences(count: int) -> str:
+    return " ".join(f"Sentence number {i} is here." for i in range(count))
+
+
+def test_short_text_is_a_single_chunk():
+    assert split_on_sentences("One. Two.", target_chars=100) == ["One. Two."]
+
+
+def test_empty_text_has_no_chunks():
+    assert split_on_sentences("", target_chars=100) == []
+
+
+def test_chunks_respect_target_and_end_on_sentences():
+    text = _sentences(500)
+    chunks = split_on_sentences(text, target_chars=1000)
+    assert len(chunks) > 1
+    assert all(len(chunk) <= 1000 for chunk in chunks)
+    assert all(chunk.endswith(".") for chunk in chunks)
+
+
+def test_chunks_do_not_overlap_and_rejoin_to_the_input():
+    text = _sentences(500)
+    chunks = split_on_sentences(text, target_chars=1000)
+    assert " ".join(chunks) == text
+    assert stitch_chunks(chunks) == text
+
+
+def test_unpunctuated_text_is_split_on_whole_words():
+    words = [f"word{i}" for i in range(3000)]
+    text = " ".join(words)
+    chunks = split_on_sentences(text, target_chars=997)
+    assert len(chunks) > 1
+    assert all(len(chunk) <= 997 for chunk in chunks)
+    vocabulary = set(words)
+    for chunk in chunks:
+        assert chunk.split(" ")[0] in vocabulary
+        assert chunk.split(" ")[-1] in vocabulary
+    assert " ".join(chunks) == text
+
+
+def test_text_without_spaces_is_hard_split():
+    text = "x" * 2500
+    chunks = split_on_sentences(text, target_chars=1000)
+    assert [len(chunk) for chunk in chunks] == [1000, 1000, 500]
+
+
+def test_stitch_skips_empty_parts_and_strips_whitespace():
+    assert stitch_chunks(["  first.\n", "", "   ", "second. "]) == "first. second."
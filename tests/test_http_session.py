@@ -0,0 +1,18 @@
+"""Tests for utils.http_session."""
+
+import threading
+
+from utils.http_session import ADAPTER, get_session
+
+
+def test_session_is_per_thread_and_shares_the_adapter():
+    sessions = []
+    thread = threading.Thread(target=lambda: sessions.append(get_session()))
+    thread.start()
+    thread.join()
+
+    main_session = get_session()
+    assert get_session() is main_session
+    assert sessions[0] is not main_session
+    for session in (main_session, sessions[0]):
+        assert session.get_adapter("https://www.youtube.com/") is ADAPTER
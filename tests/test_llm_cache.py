@@ -0,0 +1,59 @@
+"""Tests for the on-disk LLM response cache in utils.llm_client."""
+
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("langchain_openai")
+
+from utils import llm_client  # noqa: E402
+
+CALL = {"system_prompt": "system", "user_payload": {"transcript": "hello"}, "model_name": "gpt4o"}
+
+
+class _StubModel:
+    def __init__(self, reply):
+        self.reply = reply
+        self.calls = 0
+
+    def invoke(self, messages, **kwargs):
+        self.calls += 1
+        return SimpleNamespace(content=self.reply)
+
+
+@pytest.fixture
+def stub_model(tmp_path, monkeypatch):
+    monkeypatch.setattr(llm_client, "LLM_CACHE_DIR", tmp_path)
+    model = _StubModel("corrected text")
+    monkeypatch.setattr(llm_client, "_prepare_invocation", lambda **kwargs: (model, [], {}))
+    return model
+
+
+def _cache_files(tmp_path):
+    return [path for path in tmp_path.rglob("*.txt")]
+
+
+def test_cache_hit_skips_the_model(stub_model, tmp_path):
+    assert llm_client.invoke_llm(**CALL) == "corrected text"
+    stub_model.reply = "different"
+    assert llm_client.invoke_llm(**CALL) == "corrected text"
+    assert stub_model.calls == 1
+    assert len(_cache_files(tmp_path)) == 1
+
+
+def test_no_cache_skips_read_and_write(stub_model, tmp_path):
+    llm_client.invoke_llm(**CALL)
+    stub_model.reply = "fresh"
+    assert llm_client.invoke_llm(**CALL, use_cache=False) == "fresh"
+    assert stub_model.calls == 2
+    [entry] = _cache_files(tmp_path)
+    assert entry.read_text(encoding="utf-8") == "corrected text"
+
+
+def test_empty_result_is_not_cached(stub_model, tmp_path):
+    stub_model.reply = "  "
+    assert llm_client.invoke_llm(**CALL) == "  "
+    assert _cache_files(tmp_path) == []
+    stub_model.reply = "retried"
+    assert llm_client.invoke_llm(**CALL) == "retried"
+    assert stub_model.calls == 2
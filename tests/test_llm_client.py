@@ -0,0 +1,27 @@
+"""Tests for utils.llm_client request building."""
+
+import pytest
+
+pytest.importorskip("langchain_openai")
+
+from utils.llm_client import build_responses_body  # noqa: E402
+
+
+def test_responses_body_omits_temperature_for_gpt5_alias():
+    body = build_responses_body(
+        system_prompt="system",
+        user_payload={"transcript": "hello world"},
+        model_name="gpt5-low",
+    )
+    assert body["model"] == "gpt-5"
+    assert "temperature" not in body
+    assert body["reasoning"] == {"effort": "low"}
+
+
+def test_responses_body_keeps_temperature_for_gpt4o():
+    body = build_responses_body(
+        system_prompt="system",
+        user_payload={"transcript": "hello world"},
+        model_name="gpt4o",
+    )
+    assert body["temperature"] == 0
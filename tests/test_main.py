@@ -0,0 +1,32 @@
+"""Tests for the stage manifest helpers in app.main."""
+
+import pytest
+
+pytest.importorskip("langchain_openai")
+pytest.importorskip("pytubefix")
+
+from app.main import load_manifest, load_stage, save_manifest  # noqa: E402
+
+
+def test_missing_manifest_is_empty(tmp_path):
+    assert load_manifest(tmp_path / "x.manifest.json") == {}
+
+
+def test_corrupt_manifest_is_empty(tmp_path):
+    path = tmp_path / "x.manifest.json"
+    path.write_text('{"passage": "ab', encoding="utf-8")
+    assert load_manifest(path) == {}
+
+
+def test_manifest_round_trip(tmp_path):
+    path = tmp_path / "x.manifest.json"
+    save_manifest(path, {"passage": "abc"})
+    assert load_manifest(path) == {"passage": "abc"}
+
+
+def test_load_stage_requires_manifest_entry_and_file(tmp_path):
+    output = tmp_path / "x_corrected.txt"
+    output.write_text("done", encoding="utf-8")
+    assert load_stage({}, "corrected", output) is None
+    assert load_stage({"corrected": "h"}, "corrected", output) == "done"
+    assert load_stage({"corrected": "h"}, "corrected", tmp_path / "missing.txt") is None
@@ -0,0 +1,133 @@
+"""Tests for utils.youtube helpers."""
+
+import pytest
+
+pytest.importorskip("pytubefix")
+pytest.importorskip("youtube_transcript_api")
+
+from utils import youtube  # noqa: E402
+
+DATA = bytes(range(256)) * 40
+
+
+class _Response:
+    def __init__(self, status_code, content=b""):
+        self.status_code = status_code
+        self.content = content
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+
+class _RangeSession:
+    """Serves byte ranges, or a fixed status when ranges are rejected."""
+
+    def __init__(self, reject_status=None):
+        self.reject_status = reject_status
+
+    def get(self, url, headers, timeout, stream):
+        assert stream is True
+        if self.reject_status is not None:
+            return _Response(self.reject_status, DATA)
+        start, end = (int(value) for value in headers["Range"][len("bytes=") :].split("-"))
+        return _Response(206, DATA[start : end + 1])
+
+
+class _Stream:
+    url = "https://example.invalid/video"
+    filesize = len(DATA)
+    default_filename = "video.mp4"
+
+    def __init__(self):
+        self.fallback_calls = 0
+
+    def download(self, output_path):
+        self.fallback_calls += 1
+        path = youtube.Path(output_path) / "fallback.mp4"
+        path.write_bytes(DATA)
+        return str(path)
+
+
+@pytest.fixture
+def small_chunks(monkeypatch):
+    monkeypatch.setattr(youtube, "DOWNLOAD_CHUNK_BYTES", 1000)
+
+
+def test_parallel_range_download(tmp_path, monkeypatch, small_chunks):
+    session = _RangeSession()
+    monkeypatch.setattr(youtube, "get_session", lambda: session)
+    stream = _Stream()
+    path = youtube._download_stream(stream, tmp_path)
+    assert path == tmp_path / "video.mp4"
+    assert path.read_bytes() == DATA
+    assert stream.fallback_calls == 0
+    assert [p.name for p in tmp_path.iterdir()] == ["video.mp4"]
+
+
+@pytest.mark.parametrize("status", [200, 403, 416])
+def test_falls_back_when_range_is_rejected(tmp_path, monkeypatch, small_chunks, status):
+    session = _RangeSession(reject_status=status)
+    monkeypatch.setattr(youtube, "get_session", lambda: session)
+    stream = _Stream()
+    path = youtube._download_stream(stream, tmp_path)
+    assert path.name == "fallback.mp4"
+    assert stream.fallback_calls == 1
+    assert [p.name for p in tmp_path.iterdir()] == ["fallback.mp4"]
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://www.youtube.com/watch?v=TVUibwoVXZc",
+        "https://www.youtube.com/watch?feature=share&v=TVUibwoVXZc&t=42s",
+        "https://m.youtube.com/watch?v=TVUibwoVXZc",
+        "youtube.com/watch?v=TVUibwoVXZc",
+        "https://youtu.be/TVUibwoVXZc",
+        "https://youtu.be/TVUibwoVXZc?si=AbCdEf123",
+        "https://www.youtube.com/embed/TVUibwoVXZc",
+        "https://www.youtube.com/v/TVUibwoVXZc",
+        "https://www.youtube.com/shorts/TVUibwoVXZc",
+    ],
+)
+def test_extract_video_id_accepts_supported_forms(url):
+    assert youtube.extract_video_id(url) == "TVUibwoVXZc"
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://example.com/?u=youtube.com/watch?v=TVUibwoVXZc",
+        "https://notyoutube.com.evil.io/watch?v=TVUibwoVXZc",
+        "https://www.youtube.com/watch?list=PL123",
+        "https://www.youtube.com/watch?v=TVUibwoVXZcEXTRA",
+    ],
+)
+def test_extract_video_id_rejects_other_urls(url):
+    with pytest.raises(ValueError):
+        youtube.extract_video_id(url)
+
+
+@pytest.mark.parametrize(
+    ("title", "expected"),
+    [
+        ("a: b", "a_b"),
+        ("Hello, World! (Part 1/2)", "Hello_World_Part_1_2"),
+        ("keep-dashes and_underscores", "keep-dashes_and_underscores"),
+        ("Şehir İstanbul — 2024", "Şehir_İstanbul_2024"),
+        ("?!: // ...", "youtube_video"),
+        ("", "youtube_video"),
+    ],
+)
+def test_sanitize_filename(title, expected):
+    assert youtube.sanitize_filename(title) == expected
+
+
+def test_sanitize_filename_truncates_long_titles():
+    assert youtube.sanitize_filename("x" * 500) == "x" * 120
@@ -2,13 +2,63 @@
 
 from __future__ import annotations
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Tuple
+from typing import Any, ClassVar, Dict, List, Optional, Tuple
 
-from utils.llm_client import invoke_llm
+from utils.chunking import split_on_sentences, stitch_chunks
+from utils.llm_client import ainvoke_llm
 from utils.prompt_loader import load_prompt
-from utils.youtube import download_video, fetch_transcript_text, sanitize_filename
+from utils.youtube import download_video, extract_video_id, iter_transcript, sanitize_filename
+
+CHUNK_TARGET_CHARS = 20000
+
+
+async def _run_chunked(
+    system_prompt: str, payload: Dict[str, Any], model_name: str, use_cache: bool = True
+) -> str:
+    """Fan a long transcript out over concurrent LLM calls and stitch the results."""
+    chunks = split_on_sentences(
+        payload["transcript"],
+        target_chars=CHUNK_TARGET_CHARS,
+    )
+    if len(chunks) <= 1:
+        return await ainvoke_llm(
+            system_prompt=system_prompt,
+            user_payload=payload,
+            model_name=model_name,
+            use_cache=use_cache,
+        )
+
+    tasks = [
+        ainvoke_llm(
+            system_prompt=system_prompt,
+            user_payload={**payload, "transcript": chunk},
+            model_name=model_name,
+            use_cache=use_cache,
+        )
+        for chunk in chunks
+    ]
+    results = await asyncio.gather(*tasks)
+    return stitch_chunks(results)
+
+
+def _stream_transcript(url: str, path: Path, max_chars: Optional[int]) -> str:
+    """Write the transcript to `path` entry by entry and return its leading text."""
+    parts: List[str] = []
+    total = 0
+    with path.open("w", encoding="utf-8") as handle:
+        separator = ""
+        for line in iter_transcript(url):
+            handle.write(separator)
+            handle.write(line)
+            separator = " "
+            if max_chars is None or total <= max_chars:
+                parts.append(line)
+                total += len(line) + 1
+    return " ".join(parts)
 
 
 @dataclass
@@ -18,15 +68,34 @@ class VideoTranscriptAgent:
     video_dir: Path
     transcript_dir: Path
 
-    def run(self, url: str) -> Tuple[Path, Path, str]:
-        """Download the video and transcript, returning paths and transcript text."""
-        video_path, title = download_video(url, self.video_dir)
-        transcript_text = fetch_transcript_text(url)
+    def run(self, url: str, max_chars: Optional[int] = None) -> Tuple[Path, Path, str]:
+        """Download the video and transcript, returning paths and transcript text.
 
+        The full transcript is streamed to disk; only the first ~`max_chars`
+        characters are kept in memory and returned (all of it when None).
+        If the transcript fails, its partial file is removed and the error is
+        raised once an already-started video download has finished.
+        """
         self.transcript_dir.mkdir(parents=True, exist_ok=True)
+        # The final filename needs the video title, so stream into a partial file first.
+        partial_path = self.transcript_dir / f".{extract_video_id(url)}.partial"
+
+        # Both fetches are independent blocking network I/O, so overlap them.
+        # The executor always waits for the download on exit so a failed URL
+        # never leaves work running outside the caller's concurrency limit.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            video_future = executor.submit(download_video, url, self.video_dir)
+            try:
+                transcript_text = _stream_transcript(url, partial_path, max_chars)
+                video_path, title = video_future.result()
+            except BaseException:
+                video_future.cancel()  # no-op if the download already started
+                partial_path.unlink(missing_ok=True)
+                raise
+
         transcript_filename = f"{sanitize_filename(title)}.txt"
         transcript_path = self.transcript_dir / transcript_filename
-        transcript_path.write_text(transcript_text, encoding="utf-8")
+        partial_path.replace(transcript_path)
 
         return video_path, transcript_path, transcript_text
 
@@ -36,16 +105,23 @@ class TranscriptCorrectionAgent:
     """Agent that fixes transcript wording while preserving all key points."""
 
     prompt_name: str = "system_modify"
+    use_cache: bool = True
+    # Corrections are local to each sentence, so chunks can be processed independently.
+    chunked: ClassVar[bool] = True
 
-    def run(self, transcript: str, model_name: str) -> str:
-        """Correct grammar, spelling, and wording issues without removing content."""
-        system_prompt = load_prompt(self.prompt_name)
-        payload = {
+    def build_payload(self, transcript: str) -> Dict[str, Any]:
+        """Build the JSON user payload for a transcript (or transcript chunk)."""
+        return {
             "task": "correct_transcript",
             "instructions": "Fix errors but keep meaning and all important points.",
             "transcript": transcript,
         }
-        return invoke_llm(system_prompt=system_prompt, user_payload=payload, model_name=model_name)
+
+    async def run(self, transcript: str, model_name: str) -> str:
+        """Correct grammar, spelling, and wording issues without removing content."""
+        system_prompt = load_prompt(self.prompt_name)
+        payload = self.build_payload(transcript)
+        return await _run_chunked(system_prompt, payload, model_name, use_cache=self.use_cache)
 
 
 @dataclass
@@ -53,16 +129,22 @@ class TranslationAgent:
     """Agent that translates the transcript into Turkish (Istanbul usage)."""
 
     prompt_name: str = "system_translate"
+    use_cache: bool = True
+    chunked: ClassVar[bool] = True
 
-    def run(self, transcript: str, model_name: str) -> str:
-        """Translate a transcript into Turkish as spoken in Istanbul."""
-        system_prompt = load_prompt(self.prompt_name)
-        payload = {
+    def build_payload(self, transcript: str) -> Dict[str, Any]:
+        """Build the JSON user payload for a transcript (or transcript chunk)."""
+        return {
             "task": "translate_transcript",
             "target_language": "Turkish (Istanbul)",
             "transcript": transcript,
         }
-        return invoke_llm(system_prompt=system_prompt, user_payload=payload, model_name=model_name)
+
+    async def run(self, transcript: str, model_name: str) -> str:
+        """Translate a transcript into Turkish as spoken in Istanbul."""
+        system_prompt = load_prompt(self.prompt_name)
+        payload = self.build_payload(transcript)
+        return await _run_chunked(system_prompt, payload, model_name, use_cache=self.use_cache)
 
 
 @dataclass
@@ -70,13 +152,25 @@ class DialogueAgent:
     """Agent that improves correctness and converts text into a dialogue style."""
 
     prompt_name: str = "system_dialogue"
+    use_cache: bool = True
+    # The prompt writes one script for the whole passage, so it must see all of it.
+    chunked: ClassVar[bool] = False
 
-    def run(self, transcript: str, model_name: str) -> str:
-        """Convert text into a dialogue style with light expansion and summary."""
-        system_prompt = load_prompt(self.prompt_name)
-        payload = {
+    def build_payload(self, transcript: str) -> Dict[str, Any]:
+        """Build the JSON user payload for the full transcript."""
+        return {
             "task": "dialogue_conversion",
             "transcript": transcript,
         }
-        return invoke_llm(system_prompt=system_prompt, user_payload=payload, model_name=model_name)
+
+    async def run(self, transcript: str, model_name: str) -> str:
+        """Convert text into a dialogue style with light expansion and summary."""
+        system_prompt = load_prompt(self.prompt_name)
+        payload = self.build_payload(transcript)
+        return await ainvoke_llm(
+            system_prompt=system_prompt,
+            user_payload=payload,
+            model_name=model_name,
+            use_cache=self.use_cache,
+        )
 
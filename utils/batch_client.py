@@ -0,0 +1,123 @@
+"""OpenAI Batch API helpers for offline, non-latency-critical pipeline runs."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from openai import OpenAI
+
+import utils.llm_client  # noqa: F401  # ensures .env is loaded before the client is built
+
+logger = logging.getLogger(__name__)
+
+BATCH_ENDPOINT = "/v1/responses"
+BATCH_TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+
+def _get_client() -> OpenAI:
+    """Create an OpenAI client from the environment."""
+    openai_api_key = os.getenv("OPENAI_API_KEY")
+    if not openai_api_key:
+        raise RuntimeError("OPENAI_API_KEY is not set in the environment.")
+    return OpenAI(api_key=openai_api_key)
+
+
+def build_batch_request(custom_id: str, body: Dict[str, Any]) -> Dict[str, Any]:
+    """Wrap a `/v1/responses` body into a Batch API JSONL request line."""
+    return {"custom_id": custom_id, "method": "POST", "url": BATCH_ENDPOINT, "body": body}
+
+
+def submit_batch(requests: List[Dict[str, Any]]) -> str:
+    """Upload the requests as a JSONL file and create a batch, returning its id."""
+    client = _get_client()
+    fd, tmp_name = tempfile.mkstemp(suffix=".jsonl")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            for request in requests:
+                handle.write(json.dumps(request, ensure_ascii=False))
+                handle.write("\n")
+        with open(tmp_name, "rb") as handle:
+            input_file = client.files.create(file=handle, purpose="batch")
+    finally:
+        Path(tmp_name).unlink(missing_ok=True)
+
+    batch = client.batches.create(
+        input_file_id=input_file.id,
+        endpoint=BATCH_ENDPOINT,
+        completion_window="24h",
+    )
+    logger.info(f"Submitted batch {batch.id} with {len(requests)} requests")
+    return batch.id
+
+
+def wait_for_batch(batch_id: str, poll_seconds: float = 30) -> Any:
+    """Poll a batch until it reaches a terminal status and return it."""
+    client = _get_client()
+    last_progress = None
+    while True:
+        batch = client.batches.retrieve(batch_id)
+        if batch.status in BATCH_TERMINAL_STATUSES:
+            break
+        counts = batch.request_counts
+        progress = (batch.status, counts.completed, counts.failed) if counts else (batch.status,)
+        if progress != last_progress:
+            # Only log changes; a batch can poll for up to 24h.
+            done = f", {counts.completed}/{counts.total} done, {counts.failed} failed" if counts else ""
+            logger.info(f"Batch {batch_id} status: {batch.status}{done}")
+            last_progress = progress
+        time.sleep(poll_seconds)
+
+    if batch.status != "completed":
+        raise RuntimeError(f"Batch {batch_id} finished with status: {batch.status}")
+    return batch
+
+
+def _response_text(body: Dict[str, Any]) -> str:
+    """Concatenate the `output_text` parts of a Responses API body."""
+    parts: List[str] = []
+    for item in body.get("output", []):
+        if item.get("type") != "message":
+            continue
+        for content in item.get("content", []):
+            if content.get("type") == "output_text":
+                parts.append(content.get("text", ""))
+    return "".join(parts)
+
+
+def _read_jsonl(client: OpenAI, file_id: str) -> List[Dict[str, Any]]:
+    """Download a batch result file and parse its JSONL records."""
+    raw = client.files.content(file_id).text
+    return [json.loads(line) for line in raw.splitlines() if line.strip()]
+
+
+def download_batch_results(batch: Any) -> Tuple[Dict[str, str], Dict[str, str]]:
+    """Download a completed batch's results.
+
+    Returns `(results, errors)`: response text by custom_id for successful
+    requests, and a description of the error by custom_id for failed ones.
+    Failed requests are listed in the batch's error file, even when the
+    batch itself finishes as `completed`.
+    """
+    client = _get_client()
+    records: List[Dict[str, Any]] = []
+    if batch.output_file_id:
+        records.extend(_read_jsonl(client, batch.output_file_id))
+    if batch.error_file_id:
+        records.extend(_read_jsonl(client, batch.error_file_id))
+
+    results: Dict[str, str] = {}
+    errors: Dict[str, str] = {}
+    for record in records:
+        custom_id = record["custom_id"]
+        response = record.get("response") or {}
+        if record.get("error") or response.get("status_code") != 200:
+            errors[custom_id] = json.dumps(record.get("error") or response.get("body") or response)
+            continue
+        results[custom_id] = _response_text(response.get("body", {}))
+    return results, errors
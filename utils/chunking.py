@@ -0,0 +1,55 @@
+"""Helpers for splitting long transcripts into chunks and joining per-chunk results."""
+
+from __future__ import annotations
+
+import re
+from typing import List
+
+_SENTENCE_END_RE = re.compile(r"(?<=[.!?…])\s+")
+
+
+def split_on_sentences(text: str, target_chars: int = 20000) -> List[str]:
+    """Split text into ~`target_chars` chunks on sentence boundaries.
+
+    Chunks do not overlap: separate LLM calls rarely reproduce shared text
+    verbatim, so overlapping outputs cannot be de-duplicated reliably.
+    Sentences longer than `target_chars` are split at the last space before
+    the limit, and cut mid-word only when they contain no spaces at all.
+    """
+    if len(text) <= target_chars:
+        return [text] if text else []
+
+    sentences: List[str] = []
+    for sentence in _SENTENCE_END_RE.split(text):
+        while len(sentence) > target_chars:
+            # Unpunctuated (auto-generated) captions form one huge "sentence";
+            # cut at the last space so words stay whole.
+            cut = sentence.rfind(" ", 0, target_chars + 1)
+            if cut > 0:
+                sentences.append(sentence[:cut])
+                sentence = sentence[cut + 1 :]
+            else:
+                sentences.append(sentence[:target_chars])
+                sentence = sentence[target_chars:]
+        if sentence:
+            sentences.append(sentence)
+
+    chunks: List[str] = []
+    current: List[str] = []
+    current_len = 0
+    for sentence in sentences:
+        if current and current_len + len(sentence) + 1 > target_chars:
+            chunks.append(" ".join(current))
+            current = []
+            current_len = 0
+        current.append(sentence)
+        current_len += len(sentence) + 1
+
+    if current:
+        chunks.append(" ".join(current))
+    return chunks
+
+
+def stitch_chunks(parts: List[str]) -> str:
+    """Join per-chunk outputs in order, skipping empty results."""
+    return " ".join(stripped for stripped in (part.strip() for part in parts) if stripped)
@@ -1,12 +1,22 @@
-import site, os
+import os
+import shutil
+import subprocess
 from pathlib import Path
 
-candidates = []
-for sp in site.getsitepackages():
-    sp = Path(sp)
-    for p in sp.rglob("node.exe"):
-        candidates.append(p)
 
-print("Found node.exe candidates:")
-for p in candidates:
-    print(" -", p)
+def find_node_candidates() -> list[Path]:
+    """Locate node executables on PATH without walking site-packages."""
+    if os.name == "nt":
+        # `where` lists every match on PATH, not just the first one.
+        result = subprocess.run(["where", "node.exe"], capture_output=True, text=True)
+        return [Path(line) for line in result.stdout.splitlines() if line.strip()]
+    node = shutil.which("node")
+    return [Path(node)] if node else []
+
+
+if __name__ == "__main__":
+    candidates = find_node_candidates()
+
+    print("Found node.exe candidates:")
+    for p in candidates:
+        print(" -", p)
@@ -0,0 +1,41 @@
+"""Shared HTTP connection pool with retry/backoff for YouTube requests."""
+
+from __future__ import annotations
+
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+def build_adapter() -> HTTPAdapter:
+    """Create a pooled adapter that retries transient failures with backoff."""
+    retry = Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        respect_retry_after_header=True,
+    )
+    return HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=retry)
+
+
+# The adapter's urllib3 pool manager is thread-safe, so connections are shared
+# process-wide. `requests.Session` is not (and youtube-transcript-api mutates
+# its headers), so each thread gets its own session on top of the adapter.
+ADAPTER = build_adapter()
+_local = threading.local()
+
+
+def get_session() -> requests.Session:
+    """Return this thread's session, mounted on the shared pooled adapter."""
+    session = getattr(_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        session.mount("https://", ADAPTER)
+        session.mount("http://", ADAPTER)
+        _local.session = session
+    return session
@@ -2,18 +2,30 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import hashlib
 import json
 import logging
 import os
-import zlib
+import tempfile
+import weakref
+from binascii import crc32 as _crc32
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar, Union
 
-from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
 from langchain_openai import ChatOpenAI
 
+try:
+    import orjson
+except ImportError:  # optional speedup; json fallback gives identical output
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+LLM_CACHE_DIR = Path(__file__).resolve().parents[1] / "data" / ".llm_cache"
+
 
 # Load environment variables from .env file
 def load_environment() -> bool:
@@ -63,6 +75,16 @@ load_environment()
 PROMPT_CACHE_SHARDS = int(os.getenv("PROMPT_CACHE_SHARDS", "1"))
 PROMPT_CACHE_RETENTION_RAW = os.getenv("PROMPT_CACHE_RETENTION", "0")
 PROMPT_VERSION = os.getenv("PROMPT_VERSION", "v1")
+SHARD_KEY_CHARS = 4096
+OPENAI_RPM = int(os.getenv("OPENAI_RPM", "600"))
+# Each in-flight slot issues at most one request per second as long as every
+# request takes at least 1s (true for these long-passage calls), so RPM/60
+# slots stay within the per-minute budget.
+LLM_MAX_CONCURRENCY = max(1, OPENAI_RPM // 60)
+
+_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
 
 
 def _parse_duration_to_seconds(value: str) -> int:
@@ -101,14 +123,30 @@ def _parse_duration_to_seconds(value: str) -> int:
 PROMPT_CACHE_RETENTION_SECONDS = _parse_duration_to_seconds(PROMPT_CACHE_RETENTION_RAW)
 
 
+def _llm_semaphore() -> asyncio.Semaphore:
+    """Return the semaphore gating concurrent LLM requests on the running loop."""
+    loop = asyncio.get_running_loop()
+    semaphore = _semaphores.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(LLM_MAX_CONCURRENCY)
+        _semaphores[loop] = semaphore
+    return semaphore
+
+
 def _stable_json_dumps(payload: Dict[str, Any]) -> str:
-    """Serialize a dict into stable, compact JSON for deterministic prompts."""
-    return json.dumps(payload, ensure_ascii=True, separators=(",", ":"), sort_keys=True)
+    """Serialize a dict into stable, compact JSON for deterministic prompts.
+
+    Uses orjson when installed; the stdlib fallback produces the same output
+    (sorted keys, compact separators, non-ASCII left unescaped).
+    """
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_SORT_KEYS).decode("utf-8")
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":"), sort_keys=True)
 
 
 def _crc32_u32(text: str) -> int:
     """Compute a non-negative CRC32 for cache sharding."""
-    return zlib.crc32(text.encode("utf-8")) & 0xFFFFFFFF
+    return _crc32(text.encode("utf-8"))
 
 
 def _build_prompt_cache_key(prefix_version: str, model: str, shard: int) -> str:
@@ -125,51 +163,171 @@ def _extract_passage(user_payload: Dict[str, Any]) -> str:
     return _stable_json_dumps(user_payload)
 
 
-def invoke_llm(
-    *,
-    system_prompt: str,
-    user_payload: Dict[str, Any],
-    model_name: str,
-    prompt_cache_retention: Optional[int] = None,
-) -> str:
-    """Invoke a chat model with a JSON user payload and optional prompt caching."""
-    openai_api_key = os.getenv("OPENAI_API_KEY")
-    if not openai_api_key:
-        raise RuntimeError("OPENAI_API_KEY is not set in the environment.")
+MODEL_ALIASES = {
+    "gpt40": "gpt-4o",
+    "gpt-40": "gpt-4o",
+    "gpt4o": "gpt-4o",
+    "gpt4o-mini": "gpt-4o-mini",
+    "gpt-4o-mini": "gpt-4o-mini",
+    "gpt5-low": "gpt-5",
+    "gpt5-medium": "gpt-5",
+    "gpt5-high": "gpt-5",
+    "gpt5-nano": "gpt-5-nano",
+    "gpt-5-nano": "gpt-5-nano",
+    "gpt5-1": "gpt-5-1",
+}
 
-    alias_map = {
-        "gpt40": "gpt-4o",
-        "gpt-40": "gpt-4o",
-        "gpt4o": "gpt-4o",
-        "gpt4o-mini": "gpt-4o-mini",
-        "gpt-4o-mini": "gpt-4o-mini",
-        "gpt5-low": "gpt-5",
-        "gpt5-medium": "gpt-5",
-        "gpt5-high": "gpt-5",
-        "gpt5-nano": "gpt-5-nano",
-        "gpt-5-nano": "gpt-5-nano",
-        "gpt5-1": "gpt-5-1",
-    }
-    chosen_model = alias_map.get(model_name, model_name)
 
-    passage = _extract_passage(user_payload)
-    runtime_json = _stable_json_dumps({"passage": passage})
-    messages = [
-        SystemMessage(content=system_prompt),
-        HumanMessage(content=f"the passage is:\n{passage}"),
-    ]
+def _resolve_model(model_name: str) -> str:
+    """Map a model alias (e.g. `gpt5-low`) to the API model name."""
+    return MODEL_ALIASES.get(model_name, model_name)
 
+
+def _cache_path(system_prompt: str, user_payload: Dict[str, Any], model_name: str) -> Path:
+    """Return the on-disk cache location for a request's content hash."""
+    material = system_prompt + _resolve_model(model_name) + _stable_json_dumps(user_payload) + PROMPT_VERSION
+    key = hashlib.sha256(material.encode("utf-8")).hexdigest()
+    return LLM_CACHE_DIR / key[:2] / f"{key}.txt"
+
+
+def _read_cache(path: Path) -> Optional[str]:
+    """Return cached text, or None on a miss (an empty entry counts as a miss)."""
+    try:
+        text = path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+    return text if text.strip() else None
+
+
+def _write_cache(path: Path, text: str) -> None:
+    """Write a cache entry atomically so readers never see partial files."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            handle.write(text)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+_SyncLLM = TypeVar("_SyncLLM", bound=Callable[..., str])
+_AsyncLLM = TypeVar("_AsyncLLM", bound=Callable[..., Awaitable[str]])
+
+
+def _disk_cached(func: _SyncLLM) -> _SyncLLM:
+    """Memoize an LLM call on disk by content hash; pass `use_cache=False` to bypass."""
+
+    @functools.wraps(func)
+    def wrapper(*, use_cache: bool = True, **kwargs: Any) -> str:
+        if not use_cache:
+            return func(**kwargs)
+        path = _cache_path(kwargs["system_prompt"], kwargs["user_payload"], kwargs["model_name"])
+        cached = _read_cache(path)
+        if cached is not None:
+            return cached
+        result = func(**kwargs)
+        # Empty completions (e.g. all tokens spent on reasoning) must be retried, not replayed.
+        if result.strip():
+            _write_cache(path, result)
+        return result
+
+    return wrapper  # type: ignore[return-value]
+
+
+def _adisk_cached(func: _AsyncLLM) -> _AsyncLLM:
+    """Async counterpart of `_disk_cached`; file access runs in a worker thread."""
+
+    @functools.wraps(func)
+    async def wrapper(*, use_cache: bool = True, **kwargs: Any) -> str:
+        if not use_cache:
+            return await func(**kwargs)
+        path = _cache_path(kwargs["system_prompt"], kwargs["user_payload"], kwargs["model_name"])
+        cached = await asyncio.to_thread(_read_cache, path)
+        if cached is not None:
+            return cached
+        result = await func(**kwargs)
+        if result.strip():
+            await asyncio.to_thread(_write_cache, path, result)
+        return result
+
+    return wrapper  # type: ignore[return-value]
+
+
+def _content_text(content: Union[str, List[Any]]) -> str:
+    """Flatten message content, which the Responses API may return as a list of parts."""
+    if isinstance(content, str):
+        return content
+    return "".join(
+        part if isinstance(part, str) else part.get("text", "")
+        for part in content
+        if isinstance(part, str) or part.get("type") == "text"
+    )
+
+
+def _prompt_cache_settings(
+    passage: str, chosen_model: str, prompt_cache_retention: Optional[int]
+) -> Tuple[int, str]:
+    """Resolve the prompt cache retention and sharded cache key for a passage."""
     retention = PROMPT_CACHE_RETENTION_SECONDS if prompt_cache_retention is None else prompt_cache_retention
     shard = 0
     if PROMPT_CACHE_SHARDS > 1:
-        shard = _crc32_u32(runtime_json) % PROMPT_CACHE_SHARDS
+        # Shard assignment only needs to be stable, so hash a bounded prefix
+        # instead of serializing and encoding the whole passage.
+        shard = _crc32_u32(passage[:SHARD_KEY_CHARS]) % PROMPT_CACHE_SHARDS
 
     prompt_cache_key = _build_prompt_cache_key(
         prefix_version=PROMPT_VERSION,
         model=chosen_model,
         shard=shard,
     )
+    return retention, prompt_cache_key
+
+
+def _supports_temperature(chosen_model: str) -> bool:
+    """Return False for reasoning gpt-5 models, which reject `temperature`.
+
+    Mirrors ChatOpenAI, which drops the parameter for `gpt-5*` models that are
+    not `chat` variants.
+    """
+    return not (chosen_model.startswith("gpt-5") and "chat" not in chosen_model)
+
+
+def build_responses_body(
+    *,
+    system_prompt: str,
+    user_payload: Dict[str, Any],
+    model_name: str,
+    prompt_cache_retention: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Build a raw `/v1/responses` request body matching what `invoke_llm` sends."""
+    chosen_model = _resolve_model(model_name)
+    passage = _extract_passage(user_payload)
+    retention, prompt_cache_key = _prompt_cache_settings(passage, chosen_model, prompt_cache_retention)
 
+    body: Dict[str, Any] = {
+        "model": chosen_model,
+        "input": [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": f"the passage is:\n{passage}"},
+        ],
+    }
+    if _supports_temperature(chosen_model):
+        body["temperature"] = 0
+    if retention and retention > 0:
+        body["prompt_cache_key"] = prompt_cache_key
+        body["prompt_cache_retention"] = retention
+    if chosen_model in ["gpt-5", "gpt-5-1"]:
+        body["reasoning"] = {"effort": "low"}
+    return body
+
+
+@functools.lru_cache(maxsize=16)
+def _get_client(
+    openai_api_key: str, chosen_model: str, retention: int, reasoning_effort: Optional[str]
+) -> ChatOpenAI:
+    """Return a shared ChatOpenAI instance so its HTTP connection pool is reused."""
     llm_kwargs: Dict[str, Any] = {
         "model": chosen_model,
         "temperature": 0,
@@ -182,19 +340,79 @@ def invoke_llm(
     if retention and retention > 0:
         llm_kwargs["prompt_cache_retention"] = retention
 
-    if chosen_model in ["gpt-5", "gpt-5-1"]:
-        llm_kwargs["reasoning"] = {"effort": "low"}
+    if reasoning_effort:
+        llm_kwargs["reasoning"] = {"effort": reasoning_effort}
+
+    return ChatOpenAI(**llm_kwargs)
+
+
+def _prepare_invocation(
+    *,
+    system_prompt: str,
+    user_payload: Dict[str, Any],
+    model_name: str,
+    prompt_cache_retention: Optional[int] = None,
+) -> Tuple[ChatOpenAI, List[BaseMessage], Dict[str, Any]]:
+    """Build the chat model, messages, and per-call kwargs for a single LLM request."""
+    openai_api_key = os.getenv("OPENAI_API_KEY")
+    if not openai_api_key:
+        raise RuntimeError("OPENAI_API_KEY is not set in the environment.")
+
+    chosen_model = _resolve_model(model_name)
+
+    passage = _extract_passage(user_payload)
+    messages: List[BaseMessage] = [
+        SystemMessage(content=system_prompt),
+        HumanMessage(content=f"the passage is:\n{passage}"),
+    ]
+
+    retention, prompt_cache_key = _prompt_cache_settings(passage, chosen_model, prompt_cache_retention)
 
-    model = ChatOpenAI(**llm_kwargs)
+    reasoning_effort = "low" if chosen_model in ["gpt-5", "gpt-5-1"] else None
+    model = _get_client(openai_api_key, chosen_model, retention, reasoning_effort)
 
+    invoke_kwargs: Dict[str, Any] = {}
     if retention and retention > 0:
-        response = model.invoke(
-            messages,
-            prompt_cache_key=prompt_cache_key,
-            prompt_cache_retention=retention,
-        )
-    else:
-        response = model.invoke(messages)
+        invoke_kwargs["prompt_cache_key"] = prompt_cache_key
+        invoke_kwargs["prompt_cache_retention"] = retention
+
+    return model, messages, invoke_kwargs
+
+
+@_disk_cached
+def invoke_llm(
+    *,
+    system_prompt: str,
+    user_payload: Dict[str, Any],
+    model_name: str,
+    prompt_cache_retention: Optional[int] = None,
+) -> str:
+    """Invoke a chat model with a JSON user payload and optional prompt caching."""
+    model, messages, invoke_kwargs = _prepare_invocation(
+        system_prompt=system_prompt,
+        user_payload=user_payload,
+        model_name=model_name,
+        prompt_cache_retention=prompt_cache_retention,
+    )
+    response = model.invoke(messages, **invoke_kwargs)
+    return _content_text(response.content)
 
-    return getattr(response, "content", str(response))
 
+@_adisk_cached
+async def ainvoke_llm(
+    *,
+    system_prompt: str,
+    user_payload: Dict[str, Any],
+    model_name: str,
+    prompt_cache_retention: Optional[int] = None,
+) -> str:
+    """Asynchronously invoke a chat model; same contract as `invoke_llm`."""
+    model, messages, invoke_kwargs = _prepare_invocation(
+        system_prompt=system_prompt,
+        user_payload=user_payload,
+        model_name=model_name,
+        prompt_cache_retention=prompt_cache_retention,
+    )
+    async with _llm_semaphore():
+        response = await model.ainvoke(messages, **invoke_kwargs)
+    return _content_text(response.content)
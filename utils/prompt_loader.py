@@ -1,14 +1,15 @@
 """Prompt loading utilities for the video processing pipeline."""
 
+from functools import lru_cache
 from pathlib import Path
 
 PROMPTS_DIR = Path(__file__).resolve().parents[1] / "prompts"
 
 
+@lru_cache(maxsize=32)
 def load_prompt(name: str) -> str:
-    """Load a prompt by basename from the prompts directory."""
+    """Load a prompt by basename from the prompts directory (memoized per process)."""
     prompt_path = PROMPTS_DIR / f"{name}.txt"
     if not prompt_path.exists():
         raise FileNotFoundError(f"Prompt not found: {prompt_path}")
     return prompt_path.read_text(encoding="utf-8").strip()
-
@@ -2,30 +2,51 @@
 
 from __future__ import annotations
 
+import re
+import string
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from urllib.parse import parse_qs, urlparse
+from typing import Any, Iterator
 
 from pytubefix import YouTube
 from youtube_transcript_api import YouTubeTranscriptApi
 
+from utils.http_session import get_session
+
+_VIDEO_ID_RE = re.compile(
+    r"^(?:https?://)?(?:[\w-]+\.)?"
+    r"(?:youtu\.be/|youtube\.com/(?:watch\?(?:[^#]*&)?v=|embed/|v/|shorts/))"
+    r"([A-Za-z0-9_-]{11})(?![A-Za-z0-9_-])"
+)
+_FILENAME_ALLOWED = set(string.ascii_letters + string.digits + " -_")
+_FILENAME_TABLE = {i: (chr(i) if chr(i) in _FILENAME_ALLOWED else "_") for i in range(128)}
+_FILENAME_COLLAPSE_RE = re.compile(r"[\s_]+")
+
+DOWNLOAD_WORKERS = 8
+DOWNLOAD_CHUNK_BYTES = 8 * 1024 * 1024
+RANGE_REJECTED_STATUSES = (403, 416)
+
+
+class RangeNotSupportedError(RuntimeError):
+    """Raised when the stream server ignores HTTP Range requests."""
+
 
 def extract_video_id(url: str) -> str:
     """Extract the YouTube video ID from common URL formats."""
-    parsed = urlparse(url)
-    if parsed.hostname in {"youtu.be"}:
-        return parsed.path.lstrip("/")
-    if parsed.hostname in {"www.youtube.com", "youtube.com", "m.youtube.com"}:
-        query = parse_qs(parsed.query)
-        if "v" in query:
-            return query["v"][0]
+    match = _VIDEO_ID_RE.search(url)
+    if match:
+        return match.group(1)
     raise ValueError(f"Unsupported YouTube URL format: {url}")
 
 
 def sanitize_filename(text: str) -> str:
     """Make a filesystem-safe filename from a title string."""
-    safe = "".join(ch if ch.isalnum() or ch in {" ", "-", "_"} else "_" for ch in text)
-    safe = "_".join(part for part in safe.split() if part)
-    return safe[:120] if safe else "youtube_video"
+    safe = text.translate(_FILENAME_TABLE)
+    if not safe.isascii():
+        # Non-ASCII characters are not in the table; keep letters/digits only.
+        safe = "".join(ch if ch.isascii() or ch.isalnum() else "_" for ch in safe)
+    safe = _FILENAME_COLLAPSE_RE.sub("_", safe).strip("_")
+    return safe[:120] or "youtube_video"
 
 
 def download_video(url: str, output_dir: Path) -> tuple[Path, str]:
@@ -40,19 +61,87 @@ def download_video(url: str, output_dir: Path) -> tuple[Path, str]:
     )
     if stream is None:
         raise RuntimeError("No progressive MP4 stream found for this video.")
-    video_path = Path(stream.download(output_path=str(output_dir)))
+    video_path = _download_stream(stream, output_dir)
     return video_path, yt.title or "youtube_video"
 
 
-def fetch_transcript_text(url: str) -> str:
-    """Retrieve the transcript text for a YouTube video."""
+def _fetch_range_into(url: str, path: Path, start: int, end: int) -> None:
+    """Fetch bytes [start, end] of `url` and write them at the same offset in `path`."""
+    # stream=True defers the body so a server that ignores Range (200 + full
+    # file) is detected before anything is downloaded.
+    with get_session().get(url, headers={"Range": f"bytes={start}-{end}"}, timeout=60, stream=True) as response:
+        # 403/416 on a Range request means the server rejects ranges, not the video.
+        if response.status_code in RANGE_REJECTED_STATUSES:
+            raise RangeNotSupportedError(f"Range request rejected with {response.status_code}")
+        response.raise_for_status()
+        if response.status_code != 206:
+            raise RangeNotSupportedError(f"Expected 206 Partial Content, got {response.status_code}")
+        data = response.content
+    if len(data) != end - start + 1:
+        raise RuntimeError(f"Short read for bytes {start}-{end}: got {len(data)} bytes")
+    with path.open("r+b") as handle:
+        handle.seek(start)
+        handle.write(data)
+
+
+def _download_stream(stream: Any, output_dir: Path) -> Path:
+    """Download a stream with parallel HTTP Range requests.
+
+    Falls back to `stream.download` when the size is unknown or the server
+    rejects Range requests.
+    """
+    filesize = stream.filesize
+    if not filesize:
+        return Path(stream.download(output_path=str(output_dir)))
+
+    video_path = output_dir / stream.default_filename
+    if video_path.exists() and video_path.stat().st_size == filesize:
+        return video_path
+
+    # Download into a pre-sized partial file so an interrupted run is never mistaken for a full one.
+    partial_path = video_path.with_name(video_path.name + ".part")
+    with partial_path.open("wb") as handle:
+        handle.truncate(filesize)
+
+    ranges = [
+        (start, min(start + DOWNLOAD_CHUNK_BYTES, filesize) - 1)
+        for start in range(0, filesize, DOWNLOAD_CHUNK_BYTES)
+    ]
+    try:
+        with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as executor:
+            futures = [
+                executor.submit(_fetch_range_into, stream.url, partial_path, start, end) for start, end in ranges
+            ]
+            try:
+                for future in futures:
+                    future.result()
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+    except RangeNotSupportedError:
+        partial_path.unlink(missing_ok=True)
+        return Path(stream.download(output_path=str(output_dir)))
+    except BaseException:
+        partial_path.unlink(missing_ok=True)
+        raise
+
+    partial_path.replace(video_path)
+    return video_path
+
+
+def iter_transcript(url: str) -> Iterator[str]:
+    """Yield the stripped text of each transcript entry for a YouTube video."""
     video_id = extract_video_id(url)
     # The library has had multiple API shapes across versions. Support both.
     if hasattr(YouTubeTranscriptApi, "get_transcript"):
         entries = YouTubeTranscriptApi.get_transcript(video_id)  # type: ignore[attr-defined]
-        return " ".join(entry.get("text", "").strip() for entry in entries if entry.get("text"))
-
-    # Fallback: newer/alternate API that returns objects with `.text`
-    entries = YouTubeTranscriptApi().fetch(video_id)  # type: ignore[call-arg,attr-defined]
-    return " ".join(getattr(entry, "text", "").strip() for entry in entries if getattr(entry, "text", None))
+    else:
+        # Newer/alternate API that returns objects with `.text`; it accepts a
+        # session, so pooled connections and retries are reused across videos.
+        entries = YouTubeTranscriptApi(http_client=get_session()).fetch(video_id)  # type: ignore[call-arg,attr-defined]
 
+    for entry in entries:
+        text = entry.get("text") if isinstance(entry, dict) else getattr(entry, "text", None)
+        if text:
+            yield text.strip()